@@ -4,84 +4,259 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+import pyarrow as pa
+import pyarrow.dataset as ds
 import json
+import io
+import csv
 from datetime import datetime, timedelta
 import time
 import os
-import glob
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
 
 # CSV file loading functions
-@st.cache_data(ttl=30)  # Cache for 30 seconds for live updates
-def get_steam_prices_data():
-    try:
-        if os.path.exists("steam_prices.csv"):
-            df = pd.read_csv("steam_prices.csv")
-            if not df.empty:
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-                df['created_at'] = pd.to_datetime(df['created_at'])
-            return df
-        return pd.DataFrame()
-    except Exception as e:
-        st.error(f"Error loading steam prices: {e}")
-        return pd.DataFrame()
+# Date columns per collector CSV: (ISO date columns, unix-epoch columns)
+CSV_DATES = {
+    "steam_prices.csv": (['timestamp', 'created_at'], []),
+    "tf2_orders.csv": (['created_at'], []),
+    "tf2_listings.csv": (['created_at'], []),
+    "supply_data.csv": (['created_at'], ['timestamp']),
+    "monitor_data.csv": (['created_at'], ['timestamp']),
+    "alerts.csv": (['created_at'], ['timestamp']),
+}
 
-@st.cache_data(ttl=30)
-def get_tf2_market_data():
-    try:
-        order_df = pd.DataFrame()
-        listing_df = pd.DataFrame()
-        
-        if os.path.exists("tf2_orders.csv"):
-            order_df = pd.read_csv("tf2_orders.csv")
-            if not order_df.empty:
-                order_df['created_at'] = pd.to_datetime(order_df['created_at'])
-        
-        if os.path.exists("tf2_listings.csv"):
-            listing_df = pd.read_csv("tf2_listings.csv")
-            if not listing_df.empty:
-                listing_df['created_at'] = pd.to_datetime(listing_df['created_at'])
-            
-        return order_df, listing_df
-    except Exception as e:
-        st.error(f"Error loading TF2 market data: {e}")
-        return pd.DataFrame(), pd.DataFrame()
+def _read_csv(source, date_cols=(), epoch_cols=(), engine="pyarrow", **kwargs):
+    # pyarrow's multi-threaded tokenizer parses the ISO date columns in the same
+    # pass; the unix-epoch columns come back numeric and get one vectorized cast.
+    df = pd.read_csv(source, engine=engine, parse_dates=list(date_cols), **kwargs)
+    for col in epoch_cols:
+        df[col] = pd.to_datetime(df[col], unit='s')
+    return df
 
-@st.cache_data(ttl=30)
-def get_supply_data():
-    try:
-        if os.path.exists("supply_data.csv"):
-            df = pd.read_csv("supply_data.csv")
-            if not df.empty:
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-                df['created_at'] = pd.to_datetime(df['created_at'])
-            return df
-        return pd.DataFrame()
-    except Exception as e:
-        st.error(f"Error loading supply data: {e}")
-        return pd.DataFrame()
+def _stat(path):
+    # (path, mtime) cache key: cached readers rerun only when the file changes
+    return (path, os.path.getmtime(path)) if os.path.exists(path) else (path, 0)
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _csv_entries():
+    # {file name: (size, mtime)} for the CSVs in the working directory from a
+    # single directory read, shared by the sidebar and the order book scan
+    with os.scandir(".") as it:
+        return {
+            e.name: (e.stat().st_size, e.stat().st_mtime)
+            for e in it
+            if e.name.endswith(".csv") and not e.name.startswith(".") and e.is_file()
+        }
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _csv_header(stat):
+    # Column names from the header line alone
+    path, _ = stat
+    with open(path, newline="") as fh:
+        return next(csv.reader(fh), [])
+
+def _downcast(df):
+    # The charts and metrics don't need 64-bit precision; 32-bit columns halve
+    # the memory the mean/max/cumsum passes stream through. Prices stay float64
+    # from 2**24 ₫ up, where float32 can no longer hold every whole number.
+    prices = df.get('lowest_price_float')
+    if prices is not None and pd.api.types.is_float_dtype(prices) and not (prices.abs() >= 2**24).any():
+        df['lowest_price_float'] = prices.astype('float32')
+    int32 = np.iinfo(np.int32)
+    for col in ('supply_count', 'price_vnd'):
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]) and df[col].between(int32.min, int32.max).all():
+            df[col] = df[col].astype('int32')
+    return df
+
+@st.cache_resource(show_spinner=False)
+def _mirror_versions():
+    # {CSV path: (st_mtime_ns, size)} of the source each parquet mirror was built from
+    return {}
+
+def _parquet_mirror(path, date_cols=(), **kwargs):
+    # Keep a Snappy parquet copy next to the CSV, rewritten only when the CSV's
+    # mtime or size differs from the version it was built from. Size is checked
+    # too since two writes can land within one tick of the coarse mtime clock.
+    # Returns the copy's path and that (st_mtime_ns, size) version.
+    pq_path = os.path.splitext(path)[0] + ".parquet"
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    versions = _mirror_versions()
+    if versions.get(path) != version or not os.path.exists(pq_path):
+        with open(path, "rb") as fh:
+            buf = fh.read()
+        # Record the bytes actually read, in case the file grew since the stat
+        version = (stat.st_mtime_ns, len(buf))
+        # A collector may be part-way through the last line; it is picked up on
+        # the rewrite that follows its next write
+        end = buf.rfind(b"\n") + 1 or len(buf)
+        # The C parser plus pd.to_datetime reads dates the way the order book tab
+        # always has: source UTC offsets are kept and numeric columns still convert
+        df = _read_csv(io.BytesIO(buf[:end]), engine="c", **kwargs)
+        for col in date_cols:
+            df[col] = pd.to_datetime(df[col])
+        tmp_path = f"{pq_path}.{threading.get_ident()}.tmp"
+        _downcast(df).to_parquet(tmp_path, compression="snappy", index=False)
+        os.replace(tmp_path, pq_path)
+        versions[path] = version
+    return pq_path, version
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _snapshot_csv(stat, snap, _snap_df):
+    # Download payload for an order book snapshot, built once per file version
+    # and snapshot instead of on every rerun. Without snapshots the payload is
+    # the whole file, so its bytes are served as they are.
+    path, _ = stat
+    if snap is None:
+        with open(path, "rb") as fh:
+            return fh.read()
+    return _snap_df.to_csv(index=False).encode()
+
+@st.cache_resource(show_spinner=False)
+def _tail_state(path):
+    # Tail-read progress for one CSV, shared by all sessions
+    return {"offset": 0, "last_line": b"", "df": None, "lock": threading.Lock()}
+
+def _parse_tail(path, header, usecols, offset, last_line, cached):
+    # Parse the complete lines after byte offset, append them to cached and
+    # return the new (offset, last_line, frame)
+    with open(path, "rb") as fh:
+        fh.seek(offset - len(last_line))
+        buf = fh.read()
+    # The line parsed last must still end at offset, or the file was rewritten
+    if not buf.startswith(last_line):
+        raise ValueError(f"{path} was rewritten")
+    buf = buf[len(last_line):]
+    start = buf.find(b"\n") + 1 if offset == 0 else 0  # Skip the header line
+    end = buf.rfind(b"\n") + 1  # A half-written last line waits for the next read
+    if end <= start:
+        return offset, last_line, cached
+    chunk = buf[start:end]
+    date_cols, epoch_cols = CSV_DATES[path]
+    new_df = _read_csv(
+        io.BytesIO(chunk),
+        [c for c in date_cols if c in usecols],
+        [c for c in epoch_cols if c in usecols],
+        header=None, names=header
+    )[usecols]  # Projected here: with names=, pyarrow can't match usecols by name
+    if 'item_name' in new_df.columns:
+        new_df['item_name'] = new_df['item_name'].astype('category')
+    new_df = _downcast(new_df)
+    last_line = chunk[chunk.rfind(b"\n", 0, -1) + 1:]
+    return offset + end, last_line, new_df if cached is None else _concat_rows(cached, new_df)
+
+def _read_tail(stat, columns):
+    # The collector CSVs are append-only: parse just the lines written since the
+    # file was last read and append them to the frame kept from then.
+    # Only the columns the dashboard uses (those present in the file) are read.
+    path, _ = stat
+    header = _csv_header(stat)
+    usecols = [c for c in columns if c in header]
+    state = _tail_state(path)
+    with state["lock"]:
+        kept = state["offset"], state["last_line"], state["df"]
+        state["offset"], state["last_line"], state["df"] = 0, b"", None
+        try:
+            state["offset"], state["last_line"], state["df"] = _parse_tail(path, header, usecols, *kept)
+        except Exception:
+            # The file was rewritten, or the tail began inside a record (e.g. a
+            # quoted newline): read the whole file again
+            if not kept[0]:
+                raise
+            state["offset"], state["last_line"], state["df"] = _parse_tail(path, header, usecols, 0, b"", None)
+        df = state["df"]
+    return df if df is not None else pd.DataFrame(columns=usecols)
+
+def _concat_rows(head, tail):
+    # Give categorical columns one shared category set so pd.concat keeps them
+    # categorical instead of falling back to object
+    for col in head.select_dtypes('category').columns:
+        cats = head[col].cat.categories.union(tail[col].cat.categories)
+        head = head.assign(**{col: head[col].cat.set_categories(cats)})
+        tail = tail.assign(**{col: tail[col].cat.set_categories(cats)})
+    return pd.concat([head, tail], ignore_index=True)
+
+@st.cache_data(max_entries=6)
+def _read_head(stat, n=100):
+    # First n full-width rows for the raw data view; nrows stops the C parser early.
+    # Arrow-backed dtypes let st.dataframe serialize the preview without conversion.
+    path, _ = stat
+    return _read_csv(path, *CSV_DATES[path], engine="c", nrows=n).convert_dtypes(dtype_backend="pyarrow")
+
+# Loaders run on the loader pool, so they draw no spinner and leave error
+# reporting to the script thread
+@st.cache_data(max_entries=1, show_spinner=False)  # Keyed on file mtime, reloads only when the CSV changes
+def get_steam_prices_data(stat):
+    if os.path.exists("steam_prices.csv"):
+        return _read_tail(stat, ['item_name', 'created_at', 'lowest_price_float', 'volume'])
+    return pd.DataFrame()
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def get_tf2_market_data(order_stat, listing_stat):
+    order_df = pd.DataFrame()
+    listing_df = pd.DataFrame()
+    
+    if os.path.exists("tf2_orders.csv"):
+        order_df = _read_tail(order_stat, ['created_at'])
+    
+    if os.path.exists("tf2_listings.csv"):
+        listing_df = _read_tail(listing_stat, ['created_at'])
+        
+    return order_df, listing_df
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def get_supply_data(stat):
+    if os.path.exists("supply_data.csv"):
+        return _read_tail(stat, ['item_name', 'created_at', 'supply_count'])
+    return pd.DataFrame()
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def get_monitor_data(history_stat, alerts_stat):
+    history_df = pd.DataFrame()
+    alerts_df = pd.DataFrame()
+    
+    if os.path.exists("monitor_data.csv"):
+        history_df = _read_tail(history_stat, ['created_at'])
+    
+    if os.path.exists("alerts.csv"):
+        alerts_df = _read_tail(alerts_stat, ['item_name', 'alert_type', 'message', 'created_at'])
+        
+    return history_df, alerts_df
+
+@st.cache_resource
+def _loader_pool():
+    # Shared by all sessions; the pyarrow parser releases the GIL, so both the
+    # disk reads and the parsing of the four loaders overlap
+    return ThreadPoolExecutor(max_workers=4)
 
-@st.cache_data(ttl=30)
-def get_monitor_data():
+def _with_ctx(ctx, fn):
+    # Run a loader under the script context of the rerun that submitted it. The
+    # pool threads outlive that rerun, so the context is detached afterwards.
+    def run(*args):
+        thread = threading.current_thread()
+        add_script_run_ctx(thread, ctx)
+        try:
+            return fn(*args)
+        finally:
+            setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+    return run
+
+def _job_result(job, what, empty):
+    # Collect a loader's result, reporting its failure from the script thread
     try:
-        history_df = pd.DataFrame()
-        alerts_df = pd.DataFrame()
-        
-        if os.path.exists("monitor_data.csv"):
-            history_df = pd.read_csv("monitor_data.csv")
-            if not history_df.empty:
-                history_df['timestamp'] = pd.to_datetime(history_df['timestamp'], unit='s')
-                history_df['created_at'] = pd.to_datetime(history_df['created_at'])
-        
-        if os.path.exists("alerts.csv"):
-            alerts_df = pd.read_csv("alerts.csv")
-            if not alerts_df.empty:
-                alerts_df['timestamp'] = pd.to_datetime(alerts_df['timestamp'], unit='s')
-                alerts_df['created_at'] = pd.to_datetime(alerts_df['created_at'])
-            
-        return history_df, alerts_df
+        return job.result()
     except Exception as e:
-        st.error(f"Error loading monitor data: {e}")
-        return pd.DataFrame(), pd.DataFrame()
+        st.error(f"Error loading {what}: {e}")
+        return empty
+
+@st.cache_resource(max_entries=4)
+def _item_rows(stat, _df):
+    # Row positions per item_name, grouped once per file version so the item
+    # selectors do a dict lookup instead of scanning the whole frame
+    return _df.groupby('item_name', sort=False, observed=True).indices
 
 # Bloomberg Terminal CSS
 st.set_page_config(
@@ -90,10 +265,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-st.markdown("""
+@st.cache_resource
+def _css():
+    # Built once per process; the font is linked rather than @import-ed so the
+    # browser fetches it in parallel with the first paint
+    return """
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;700&display=swap">
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;700&display=swap">
     <style>
-        @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;700&display=swap');
-        
         .main {
             background-color: #000000;
             color: #ffffff;
@@ -186,7 +366,9 @@ st.markdown("""
             100% { opacity: 1; }
         }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_css(), unsafe_allow_html=True)
 
 # Terminal Header
 st.markdown('<div class="terminal-header">TF2 MARKET TERMINAL - LIVE CSV DATA FEED</div>', unsafe_allow_html=True)
@@ -203,10 +385,19 @@ with col3:
         st.rerun()
 
 # Load all data
-steam_prices_df = get_steam_prices_data()
-order_df, listing_df = get_tf2_market_data()
-supply_df = get_supply_data()
-history_df, alerts_df = get_monitor_data()
+steam_prices_stat = _stat("steam_prices.csv")
+supply_stat = _stat("supply_data.csv")
+# Loaders run concurrently: a cold load waits on the slowest file, not the sum
+ctx = get_script_run_ctx()
+pool = _loader_pool()
+steam_prices_job = pool.submit(_with_ctx(ctx, get_steam_prices_data), steam_prices_stat)
+tf2_market_job = pool.submit(_with_ctx(ctx, get_tf2_market_data), _stat("tf2_orders.csv"), _stat("tf2_listings.csv"))
+supply_job = pool.submit(_with_ctx(ctx, get_supply_data), supply_stat)
+monitor_job = pool.submit(_with_ctx(ctx, get_monitor_data), _stat("monitor_data.csv"), _stat("alerts.csv"))
+steam_prices_df = _job_result(steam_prices_job, "steam prices", pd.DataFrame())
+order_df, listing_df = _job_result(tf2_market_job, "TF2 market data", (pd.DataFrame(), pd.DataFrame()))
+supply_df = _job_result(supply_job, "supply data", pd.DataFrame())
+history_df, alerts_df = _job_result(monitor_job, "monitor data", (pd.DataFrame(), pd.DataFrame()))
 
 # Sidebar - Live Market Overview
 st.sidebar.markdown("## 📊 LIVE MARKET STATUS")
@@ -219,10 +410,12 @@ csv_files = [
     ("Monitor Data", "monitor_data.csv", len(history_df))
 ]
 
+csv_entries = _csv_entries()
 for file_name, file_path, record_count in csv_files:
-    file_exists = os.path.exists(file_path)
+    entry = csv_entries.get(file_path)
+    file_exists = entry is not None
     status_color = "#00ff00" if file_exists and record_count > 0 else "#ff0000"
-    file_size = os.path.getsize(file_path) if file_exists else 0
+    file_size = entry[0] if file_exists else 0
     
     st.sidebar.markdown(f"""
     <div style="background-color: #1a1a1a; padding: 10px; margin: 5px 0; border-left: 4px solid {status_color};">
@@ -236,19 +429,70 @@ for file_name, file_path, record_count in csv_files:
 if not alerts_df.empty:
     st.sidebar.markdown("## 🚨 RECENT ALERTS")
     recent_alerts = alerts_df.head(5)
-    for _, alert in recent_alerts.iterrows():
-        st.sidebar.markdown(f"""
-        <div class="alert-box" style="font-size: 0.8rem; padding: 8px;">
-            <strong>{alert['item_name']}</strong><br>
-            {alert['message']}<br>
-            <small>{alert['created_at'].strftime('%H:%M:%S')}</small>
-        </div>
-        """, unsafe_allow_html=True)
+    # Build all alert boxes with column-wise string ops and emit them as one element
+    alerts_html = (
+        '<div class="alert-box" style="font-size: 0.8rem; padding: 8px;"><strong>'
+        + recent_alerts['item_name'].astype(str) + '</strong><br>'
+        + recent_alerts['message'].astype(str) + '<br><small>'
+        + recent_alerts['created_at'].dt.strftime('%H:%M:%S') + '</small></div>'
+    ).str.cat()
+    st.sidebar.markdown(alerts_html, unsafe_allow_html=True)
+
+# Chart figures are built once per item and file version and shared across
+# reruns and sessions; st.plotly_chart only has to serialize them
+@st.cache_resource(max_entries=32)
+def _price_figure(stat, item, _item_data):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=_item_data['created_at'],
+        y=_item_data['lowest_price_float'],
+        mode='lines+markers',
+        name='Price',
+        line=dict(color='#ff6600', width=3),
+        marker=dict(size=6)
+    ))
+    
+    fig.update_layout(
+        title=f"{item} - LIVE PRICE TRACKING",
+        plot_bgcolor='#000000',
+        paper_bgcolor='#000000',
+        font=dict(color='white', family="JetBrains Mono"),
+        xaxis_title="TIME",
+        yaxis_title="PRICE (₫)",
+        height=500
+    )
+    return fig
+
+@st.cache_resource(max_entries=32)
+def _supply_figure(stat, item, _supply_item_data):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=_supply_item_data['created_at'],
+        y=_supply_item_data['supply_count'],
+        mode='lines+markers',
+        name='Supply Count',
+        line=dict(color='#00ff00', width=3),
+        marker=dict(size=6)
+    ))
+    
+    fig.update_layout(
+        title=f"{item} - SUPPLY TRACKING",
+        plot_bgcolor='#000000',
+        paper_bgcolor='#000000',
+        font=dict(color='white', family="JetBrains Mono"),
+        xaxis_title="TIME",
+        yaxis_title="SUPPLY COUNT",
+        height=400
+    )
+    return fig
 
 # Main dashboard tabs
 tab1, tab2, tab3, tab4, tab5 = st.tabs(["📈 LIVE PRICES", "📦 SUPPLY TRACKING", "📊 MARKET DEPTH", "🔔 ALERTS", "📋 RAW DATA"])
+# Each tab body is a fragment: a widget change inside a tab reruns only that tab,
+# not the loaders, the sidebar and the other four tabs
 
-with tab1:
+@st.fragment
+def _live_prices_tab(steam_prices_df, steam_prices_stat):
     st.markdown("## LIVE PRICE FEED")
     
     if not steam_prices_df.empty:
@@ -299,34 +543,18 @@ with tab1:
             """, unsafe_allow_html=True)
         
         # Item selector
-        items = sorted(steam_prices_df['item_name'].unique())
+        items = sorted(steam_prices_df['item_name'].cat.categories)
         selected_item = st.selectbox("SELECT ITEM", items)
         
         if selected_item:
-            item_data = steam_prices_df[steam_prices_df['item_name'] == selected_item].sort_values('created_at')
+            item_data = steam_prices_df.iloc[_item_rows(steam_prices_stat, steam_prices_df)[selected_item]]
+            # Collector rows are appended in time order, so the sort is usually skipped
+            if not item_data['created_at'].is_monotonic_increasing:
+                item_data = item_data.sort_values('created_at')
             
             if len(item_data) > 1 and 'lowest_price_float' in item_data.columns:
                 # Price chart
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=item_data['created_at'],
-                    y=item_data['lowest_price_float'],
-                    mode='lines+markers',
-                    name='Price',
-                    line=dict(color='#ff6600', width=3),
-                    marker=dict(size=6)
-                ))
-                
-                fig.update_layout(
-                    title=f"{selected_item} - LIVE PRICE TRACKING",
-                    plot_bgcolor='#000000',
-                    paper_bgcolor='#000000',
-                    font=dict(color='white', family="JetBrains Mono"),
-                    xaxis_title="TIME",
-                    yaxis_title="PRICE (₫)",
-                    height=500
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_price_figure(steam_prices_stat, selected_item, item_data), use_container_width=True)
                 
                 # Latest price info
                 latest = item_data.iloc[-1]
@@ -345,7 +573,11 @@ with tab1:
     else:
         st.info("No steam price data available. Run steam_price.py to collect data.")
 
-with tab2:
+with tab1:
+    _live_prices_tab(steam_prices_df, steam_prices_stat)
+
+@st.fragment
+def _supply_tab(supply_df, supply_stat):
     st.markdown("## SUPPLY TRACKING")
     
     if not supply_df.empty:
@@ -375,7 +607,11 @@ with tab2:
             """, unsafe_allow_html=True)
         
         with col3:
-            total_supply = supply_df.groupby('item_name')['supply_count'].last().sum()
+            # Last non-empty count per item, as groupby().last() gave
+            total_supply = (
+                supply_df.dropna(subset=['supply_count'])
+                .drop_duplicates('item_name', keep='last')['supply_count'].sum()
+            )
             st.markdown(f"""
             <div class="metric-container">
                 <div class="metric-label">TOTAL SUPPLY</div>
@@ -384,50 +620,37 @@ with tab2:
             """, unsafe_allow_html=True)
         
         # Supply chart
-        supply_items = sorted(supply_df['item_name'].unique())
+        supply_items = sorted(supply_df['item_name'].cat.categories)
         selected_supply_item = st.selectbox("SELECT ITEM FOR SUPPLY TRACKING", supply_items)
         
         if selected_supply_item:
-            supply_item_data = supply_df[supply_df['item_name'] == selected_supply_item].sort_values('created_at')
+            supply_item_data = supply_df.iloc[_item_rows(supply_stat, supply_df)[selected_supply_item]]
+            if not supply_item_data['created_at'].is_monotonic_increasing:
+                supply_item_data = supply_item_data.sort_values('created_at')
             
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=supply_item_data['created_at'],
-                y=supply_item_data['supply_count'],
-                mode='lines+markers',
-                name='Supply Count',
-                line=dict(color='#00ff00', width=3),
-                marker=dict(size=6)
-            ))
-            
-            fig.update_layout(
-                title=f"{selected_supply_item} - SUPPLY TRACKING",
-                plot_bgcolor='#000000',
-                paper_bgcolor='#000000',
-                font=dict(color='white', family="JetBrains Mono"),
-                xaxis_title="TIME",
-                yaxis_title="SUPPLY COUNT",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_supply_figure(supply_stat, selected_supply_item, supply_item_data), use_container_width=True)
     else:
         st.info("No supply data available. Run supply.py to collect data.")
 
+with tab2:
+    _supply_tab(supply_df, supply_stat)
+
 # >>>>>>>>>>>>>>>>>>>> UPDATED TAB3 <<<<<<<<<<<<<<<<<<<<
-with tab3:
+@st.fragment
+def _market_depth_tab():
     st.markdown("## MARKET DEPTH & ORDER BOOK (Per-Item CSVs)")
-    import glob
     ignore = set([
         "steam_prices.csv", "tf2_orders.csv", "tf2_listings.csv", "supply_data.csv",
         "monitor_data.csv", "alerts.csv", "supply.csv"
     ])
-    possible_csvs = sorted([f for f in glob.glob("*.csv") if f not in ignore])
-    orderbook_files = []
+    csv_entries = _csv_entries()
+    possible_csvs = sorted([f for f in csv_entries if f not in ignore])
+    orderbook_files = {}
     for f in possible_csvs:
         try:
-            df_tmp = pd.read_csv(f, nrows=2)
-            if set(['side', 'price_vnd', 'quantity']).issubset(df_tmp.columns):
-                orderbook_files.append(f)
+            header = _csv_header((f, csv_entries[f][1]))
+            if set(['side', 'price_vnd', 'quantity']).issubset(header):
+                orderbook_files[f] = header
         except Exception:
             continue
     if not orderbook_files:
@@ -436,19 +659,32 @@ with tab3:
         item_map = {f: f.replace(".csv", "") for f in orderbook_files}
         selected_file = st.selectbox("Select item", list(item_map.keys()), format_func=lambda x: item_map[x])
         item_name = item_map[selected_file]
-        df = pd.read_csv(selected_file)
         # Parse timestamps if present
-        if "timestamp" in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-        if "created_at" in df.columns:
-            df['created_at'] = pd.to_datetime(df['created_at'])
-        snap_col = "timestamp" if "timestamp" in df.columns else "created_at" if "created_at" in df.columns else None
+        date_cols = [c for c in ("timestamp", "created_at") if c in orderbook_files[selected_file]]
+        snap_col = date_cols[0] if date_cols else None
+        # side is stored dictionary-encoded, so it comes back categorical
+        mirror_path, mirror_version = _parquet_mirror(selected_file, date_cols, dtype={'side': 'category'})
+        dataset = ds.dataset(mirror_path, format="parquet")
+        selected_ns = selected_snap = None
         if snap_col:
-            available_snaps = sorted(df[snap_col].unique(), reverse=True)
-            selected_snap = st.selectbox("Select snapshot", [str(x) for x in available_snaps])
-            snap_df = df[df[snap_col] == pd.to_datetime(selected_snap)]
+            # Dedupe, sort and format on the datetime64 values, no Timestamp objects
+            snap_values = pd.DatetimeIndex(dataset.to_table(columns=[snap_col]).column(snap_col).to_pandas()).as_unit("ns")
+            available_snaps = snap_values.unique().sort_values(ascending=False)
+            # Snapshots are keyed by their int64 ns value; the label is display only
+            snap_labels = dict(zip(available_snaps.asi8.tolist(), available_snaps.astype(str)))
+            selected_ns = st.selectbox("Select snapshot", list(snap_labels), format_func=snap_labels.get)
+        if selected_ns is not None:
+            selected_snap = snap_labels[selected_ns]
+            # Only row groups holding the selected snapshot are decoded
+            # The scalar takes the column's own Arrow type so no precision is lost
+            snap_type = dataset.schema.field(snap_col).type
+            selected_ts = pa.scalar(selected_ns, pa.timestamp("ns", snap_type.tz)).cast(snap_type)
+            snap_df = dataset.to_table(filter=ds.field(snap_col) == selected_ts).to_pandas()
+        elif snap_col:
+            # A book with only its header has no snapshots: show it empty
+            snap_df = dataset.head(0).to_pandas()
         else:
-            snap_df = df
+            snap_df = dataset.to_table().to_pandas()
         bids = snap_df[snap_df['side'] == 'bid'].sort_values("price_vnd", ascending=False)
         asks = snap_df[snap_df['side'] == 'ask'].sort_values("price_vnd", ascending=True)
         col1, col2 = st.columns(2)
@@ -465,21 +701,17 @@ with tab3:
         # Depth chart
         fig = go.Figure()
         if not bids.empty:
-            bid_depth = bids.copy()
-            bid_depth["cum_qty"] = bid_depth["quantity"].cumsum()
             fig.add_trace(go.Scatter(
-                x=bid_depth["price_vnd"], y=bid_depth["cum_qty"],
+                x=bids["price_vnd"].to_numpy(), y=bids["quantity"].cumsum().to_numpy(),
                 mode="lines+markers", name="Bids", line_color="#00ff00", fill='tozeroy'
             ))
         if not asks.empty:
-            ask_depth = asks.copy()
-            ask_depth["cum_qty"] = ask_depth["quantity"].cumsum()
             fig.add_trace(go.Scatter(
-                x=ask_depth["price_vnd"], y=ask_depth["cum_qty"],
+                x=asks["price_vnd"].to_numpy(), y=asks["quantity"].cumsum().to_numpy(),
                 mode="lines+markers", name="Asks", line_color="#ff3300", fill='tozeroy'
             ))
         fig.update_layout(
-            title=f"Market Depth for {item_name} at {selected_snap if snap_col else ''}",
+            title=f"Market Depth for {item_name}" + (f" at {selected_snap}" if selected_snap else ""),
             xaxis_title="Price (₫)",
             yaxis_title="Cumulative Quantity",
             plot_bgcolor='#000000',
@@ -491,14 +723,20 @@ with tab3:
         with st.expander("Download raw snapshot as CSV"):
             st.download_button(
                 label="Download CSV",
-                data=snap_df.to_csv(index=False),
-                file_name=f"{item_name}_orderbook_{str(selected_snap).replace(':','-') if snap_col else 'all'}.csv",
+                data=_snapshot_csv(
+                    (selected_file, mirror_version), selected_ns, snap_df
+                ),
+                file_name=f"{item_name}_orderbook_{selected_snap.replace(':','-') if selected_snap else 'all'}.csv",
                 mime="text/csv"
             )
 
+with tab3:
+    _market_depth_tab()
+
 # >>>>>>>>>>>>>>>>>>>> END TAB3 <<<<<<<<<<<<<<<<<<<<
 
-with tab4:
+@st.fragment
+def _alerts_tab(alerts_df):
     st.markdown("## ALERT SYSTEM")
     
     if not alerts_df.empty:
@@ -540,7 +778,11 @@ with tab4:
     else:
         st.info("No alerts available. Run monitor.py to start monitoring.")
 
-with tab5:
+with tab4:
+    _alerts_tab(alerts_df)
+
+@st.fragment
+def _raw_data_tab(steam_prices_df, order_df, listing_df, supply_df, history_df, alerts_df, steam_prices_stat, supply_stat):
     st.markdown("## RAW DATA ACCESS")
     
     # Data source selector
@@ -550,26 +792,29 @@ with tab5:
     ])
     
     if data_source == "Steam Prices" and not steam_prices_df.empty:
-        st.dataframe(steam_prices_df.head(100), use_container_width=True)
+        st.dataframe(_read_head(steam_prices_stat), use_container_width=True)
         
     elif data_source == "TF2 Market Orders" and not order_df.empty:
-        st.dataframe(order_df.head(100), use_container_width=True)
+        st.dataframe(_read_head(_stat("tf2_orders.csv")), use_container_width=True)
         
     elif data_source == "TF2 Market Listings" and not listing_df.empty:
-        st.dataframe(listing_df.head(100), use_container_width=True)
+        st.dataframe(_read_head(_stat("tf2_listings.csv")), use_container_width=True)
         
     elif data_source == "Supply Data" and not supply_df.empty:
-        st.dataframe(supply_df.head(100), use_container_width=True)
+        st.dataframe(_read_head(supply_stat), use_container_width=True)
         
     elif data_source == "Monitor History" and not history_df.empty:
-        st.dataframe(history_df.head(100), use_container_width=True)
+        st.dataframe(_read_head(_stat("monitor_data.csv")), use_container_width=True)
         
     elif data_source == "Alerts" and not alerts_df.empty:
-        st.dataframe(alerts_df.head(100), use_container_width=True)
+        st.dataframe(_read_head(_stat("alerts.csv")), use_container_width=True)
     
     else:
         st.info(f"No data available for {data_source}")
 
+with tab5:
+    _raw_data_tab(steam_prices_df, order_df, listing_df, supply_df, history_df, alerts_df, steam_prices_stat, supply_stat)
+
 # Auto-refresh functionality
 if st.sidebar.checkbox("AUTO REFRESH (30s)"):
     time.sleep(30)